@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import datetime as _dt
+import logging
+import os
+import time
+
+import httpx
+import numpy as np
+import streamlit as st
+
+# pandas is imported lazily inside the functions that build DataFrames:
+# it alone accounts for most of Streamlit's cold-start import time, and
+# the metrics-only path never needs it.
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+API_KEY: str = "ed_dzv4ddrw1oq9ca7sn75xjdyqejxq496ku8l6sk9u4i3pf5f86x8axv8bwq9r4unh"
+DEVICE_ID: str = "2d9b5760-afe9-11ee-a8fb-b92f34d9b31d"
+POLL_INTERVAL_SEC: int = 60
+
+TELEMETRY_URL: str = f"https://api.edenic.io/api/v1/telemetry/{DEVICE_ID}"
+TELEMETRY_PARAMS: dict = {"keys": "ph,electrical_conductivity,temperature"}
+
+# One reading per minute, 24 h retention
+RING_SIZE: int = 1440
+
+SCOPE = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+
+try:
+    from zoneinfo import ZoneInfo
+    EASTERN = ZoneInfo("US/Eastern")
+except ImportError:
+    import pytz
+    EASTERN = pytz.timezone("US/Eastern")
+
+# Buffer Sheets rows and flush in batches to cut API round-trips
+SHEETS_BATCH_SIZE: int = 10
+SHEETS_FLUSH_SEC: int = 600
+
+# Dump history to disk every N new readings so a restart keeps the chart
+HISTORY_PATH: str = "history.parquet"
+PERSIST_EVERY: int = 10
+
+# ---------------------------------------------------------------------------
+# Helper functions
+# ---------------------------------------------------------------------------
+
+@st.cache_resource
+def _session() -> httpx.Client:
+    """Return a shared HTTP client so polls reuse one multiplexed connection."""
+    return httpx.Client(
+        http2=True,
+        headers={"Authorization": API_KEY},
+        timeout=httpx.Timeout(12.0, connect=3.05),
+        transport=httpx.HTTPTransport(retries=3),
+    )
+
+
+@st.cache_resource
+def _etag_cache() -> dict:
+    """Validator from the last 200 response, shared across reruns."""
+    return {"etag": None}
+
+
+@st.cache_resource
+def _pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Single worker that runs the network poll off the script-run thread."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+@st.cache_resource
+def _sheet():
+    """Authorize once and return the logging worksheet handle."""
+    # Imported lazily: pulling in gspread/google-auth costs ~100ms of cold
+    # start that a dashboard run without gcreds.json never needs to pay.
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    creds = Credentials.from_service_account_file("gcreds.json", scopes=SCOPE)
+    client = gspread.authorize(creds)
+    return client.open("Edenic Telemetry Log").worksheet("Sheet1")
+
+
+def _append_rows(rows: list) -> None:
+    if not rows:
+        return
+    import gspread
+
+    sheet = _sheet()
+    # Go through values_append directly: one REST call for the whole batch
+    # without gspread's per-row append wrapper. Values stay numeric so they
+    # serialize smaller than formatted strings.
+    params = {"valueInputOption": "RAW", "insertDataOption": "INSERT_ROWS"}
+    body = {"values": rows}
+    for attempt in range(5):
+        try:
+            sheet.spreadsheet.values_append(f"{sheet.title}!A:D", params=params, body=body)
+            return
+        except gspread.exceptions.APIError as err:
+            # Back off and retry only on quota exhaustion
+            if err.response.status_code != 429 or attempt == 4:
+                raise
+            time.sleep(2 ** attempt)
+
+
+def _flush_rows(rows: list) -> None:
+    _append_rows(rows)
+    rows.clear()
+
+
+def _format_stamp(t: _dt.datetime) -> str:
+    # Hand-rolled f-string; strftime goes through locale-aware C code that
+    # is an order of magnitude slower for a fixed layout
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
+def _requeue_on_failure(future: concurrent.futures.Future, batch: list, rows: list) -> None:
+    err = future.exception()
+    if err is not None:
+        logging.error("Sheets flush failed; re-queuing %d rows: %s", len(batch), err)
+        rows.extend(batch)
+
+
+def send_to_sheets(timestamp: _dt.datetime, ph: float | None, ec: float | None, temp_f: float | None) -> None:
+    rows = st.session_state["pending_rows"]
+    rows.append([_format_stamp(timestamp.astimezone(EASTERN)), ph, ec, temp_f])
+    now = time.monotonic()
+    if len(rows) >= SHEETS_BATCH_SIZE or now - st.session_state["last_flush"] > SHEETS_FLUSH_SEC:
+        # Hand the batch to the background worker so the script run never
+        # waits on the Sheets round-trip; the list is swapped out first so
+        # the worker owns its copy. A failed flush puts the batch back in
+        # the queue so it retries on the next flush instead of being lost.
+        batch = rows[:]
+        rows.clear()
+        future = _pool().submit(_append_rows, batch)
+        future.add_done_callback(lambda f: _requeue_on_failure(f, batch, rows))
+        st.session_state["last_flush"] = now
+
+
+def get_latest_telemetry() -> tuple[_dt.datetime | None, float | None, float | None, float | None]:
+    # Reads the module-level DEVICE_ID/API_KEY like the cached client and
+    # _etag_cache do; those caches are single-device, so a parametric
+    # signature here would only pretend otherwise.
+    cache = _etag_cache()
+    headers = {"If-None-Match": cache["etag"]} if cache["etag"] else None
+    response = _session().get(TELEMETRY_URL, params=TELEMETRY_PARAMS, headers=headers)
+    if response.status_code == 304:
+        # Nothing new since the last poll - skip the decode entirely
+        return None, None, None, None
+    response.raise_for_status()
+    cache["etag"] = response.headers.get("ETag")
+
+    data = _loads(response.content)
+    results = {"ph": None, "ec": None, "temp": None}
+    ts_ms = None
+
+    for api_key_name, local in (("ph", "ph"), ("electrical_conductivity", "ec"), ("temperature", "temp")):
+        lst = data.get(api_key_name)
+        if not lst:
+            continue
+        item = lst[0]
+        if ts_ms is None:
+            ts_ms = item.get("ts")
+            # Same sample as last time: return the cached tuple without
+            # redoing the per-key conversions
+            if ts_ms is not None and ts_ms == cache.get("last_ts_ms"):
+                return cache["last_reading"]
+        v = item.get("value")
+        results[local] = float(v) if v is not None else None
+
+    ts = _dt.datetime.fromtimestamp(ts_ms * 0.001, tz=_dt.timezone.utc) if ts_ms else None
+    # Celsius → Fahrenheit, applied once outside the loop
+    if results["temp"] is not None:
+        results["temp"] = results["temp"] * 1.8 + 32
+    reading = (ts, results["ph"], results["ec"], results["temp"])
+    cache["last_ts_ms"] = ts_ms
+    cache["last_reading"] = reading
+    return reading
+
+def new_buffer() -> dict:
+    return {
+        "time": np.empty(RING_SIZE, dtype="datetime64[ns]"),
+        "pH": np.full(RING_SIZE, np.nan, np.float32),
+        "EC": np.full(RING_SIZE, np.nan, np.float32),
+        "temperature": np.full(RING_SIZE, np.nan, np.float32),
+        "head": 0,
+        "count": 0,
+    }
+
+def load_buffer() -> dict:
+    """Rebuild the ring buffer from the on-disk history, if any."""
+    import pandas as pd
+
+    buf = new_buffer()
+    try:
+        df = pd.read_parquet(HISTORY_PATH)
+    except FileNotFoundError:
+        return buf
+    except Exception:
+        # A corrupt or unreadable file (pyarrow raises ArrowInvalid, a
+        # ValueError) must not take the dashboard down - start empty.
+        logging.exception("Could not read %s; starting with an empty history", HISTORY_PATH)
+        return buf
+    n = min(len(df), RING_SIZE)
+    if n:
+        tail = df.iloc[-n:]
+        buf["time"][:n] = tail["time"].to_numpy("datetime64[ns]")
+        buf["pH"][:n] = tail["pH"].to_numpy(np.float32)
+        buf["EC"][:n] = tail["EC"].to_numpy(np.float32)
+        buf["temperature"][:n] = tail["temperature"].to_numpy(np.float32)
+        buf["head"] = n % RING_SIZE
+        buf["count"] = n
+    return buf
+
+def persist_buffer(buf: dict) -> None:
+    # Write to a temp file and rename so a crash mid-write never leaves a
+    # truncated history.parquet behind
+    tmp_path = HISTORY_PATH + ".tmp"
+    history_frame(buf).reset_index().to_parquet(
+        tmp_path, engine="pyarrow", compression="zstd", index=False
+    )
+    os.replace(tmp_path, HISTORY_PATH)
+
+def append_reading(buf: dict, timestamp: _dt.datetime | None, ph: float | None, ec: float | None, temp: float | None) -> None:
+    if timestamp is None:
+        return
+    ts64 = np.datetime64(timestamp.astimezone(_dt.timezone.utc).replace(tzinfo=None))
+    i = buf["head"]
+    # Only append if time is new
+    if buf["count"] and buf["time"][(i - 1) % RING_SIZE] == ts64:
+        return
+    buf["time"][i] = ts64
+    buf["pH"][i] = ph if ph is not None else np.nan
+    buf["EC"][i] = ec if ec is not None else np.nan
+    buf["temperature"][i] = temp if temp is not None else np.nan
+    buf["head"] = (i + 1) % RING_SIZE
+    buf["count"] = min(buf["count"] + 1, RING_SIZE)
+
+def _ordered(arr: np.ndarray, head: int, count: int) -> np.ndarray:
+    # Until the ring wraps, head == count and the valid slots are a prefix
+    if count < RING_SIZE:
+        return arr[:count]
+    return np.concatenate([arr[head:], arr[:head]])
+
+def history_frame(buf: dict) -> pd.DataFrame:
+    import pandas as pd
+
+    head, count = buf["head"], buf["count"]
+    times = _ordered(buf["time"], head, count)
+    # The ring holds 24h of minute readings when polls never miss, but after
+    # an outage old slots can linger; times are appended in order, so a
+    # binary search finds the 24h cutoff without scanning a boolean mask.
+    cutoff = np.datetime64(_dt.datetime.now(_dt.timezone.utc).replace(tzinfo=None)) - np.timedelta64(24, "h")
+    start = int(np.searchsorted(times, cutoff, side="left"))
+    return pd.DataFrame(
+        {
+            "pH": _ordered(buf["pH"], head, count)[start:],
+            "EC": _ordered(buf["EC"], head, count)[start:],
+            "temperature": _ordered(buf["temperature"], head, count)[start:],
+        },
+        index=pd.DatetimeIndex(times[start:], name="time"),
+        copy=False,
+    )
+
+def _chart_df(buf: dict) -> pd.DataFrame:
+    """Return the chart-ready frame, rebuilding only when new rows arrived."""
+    if st.session_state.get("chart_df_head") != buf["head"] or "chart_df" not in st.session_state:
+        st.session_state["chart_df"] = history_frame(buf)
+        st.session_state["chart_df_head"] = buf["head"]
+    return st.session_state["chart_df"]
+
+# ---------------------------------------------------------------------------
+# Streamlit application
+# ---------------------------------------------------------------------------
+
+def _harvest(buf: dict, inflight: concurrent.futures.Future) -> None:
+    """Fold a finished poll into the buffer, Parquet dump, and Sheets queue."""
+    try:
+        ts, ph_val, ec_val, temp_val = inflight.result()
+        head_before = buf["head"]
+        append_reading(buf, ts, ph_val, ec_val, temp_val)
+        if buf["head"] != head_before:
+            st.session_state["rows_since_dump"] = st.session_state.get("rows_since_dump", 0) + 1
+            if st.session_state["rows_since_dump"] >= PERSIST_EVERY:
+                try:
+                    persist_buffer(buf)
+                    st.session_state["rows_since_dump"] = 0
+                except Exception:
+                    logging.exception("Failed to persist history to %s", HISTORY_PATH)
+            # Only export readings the buffer accepted; a poll that
+            # returned the same ts again would just duplicate the row
+            if os.path.exists("gcreds.json"):
+                try:
+                    send_to_sheets(ts, ph_val, ec_val, temp_val)
+                except Exception:
+                    logging.exception("Failed to log reading to Google Sheets")
+    except httpx.HTTPStatusError as http_err:
+        logging.exception("HTTP error while fetching telemetry")
+        st.error(f"HTTP error: {http_err}")
+    except httpx.RequestError as req_err:
+        logging.exception("Network error while fetching telemetry")
+        st.error(f"Network error: {req_err}")
+    except Exception as err:
+        logging.exception("Unexpected error while fetching telemetry")
+        st.error(f"Unexpected error: {err}")
+    st.session_state["inflight"] = None
+
+
+def _telemetry_block() -> None:
+    """The only part of the page that needs to re-execute on each tick."""
+    buf = st.session_state["buf"]
+
+    # Poll in the background so the UI never blocks on network I/O; each
+    # rerun harvests the previous poll's result and submits the next one.
+    inflight = st.session_state.get("inflight")
+    if inflight is not None and inflight.done():
+        _harvest(buf, inflight)
+        inflight = None
+
+    # The device produces at most one sample per minute, so reruns triggered
+    # by user interaction inside the interval skip the round-trip entirely.
+    now = time.monotonic()
+    if inflight is None and now >= st.session_state.get("next_poll_at", 0.0):
+        st.session_state["next_poll_at"] = now + POLL_INTERVAL_SEC
+        inflight = st.session_state["inflight"] = _pool().submit(get_latest_telemetry)
+
+    # Fresh deployment with no persisted history: wait briefly for the very
+    # first poll rather than showing an empty page until the next tick.
+    if buf["count"] == 0 and inflight is not None:
+        done, _ = concurrent.futures.wait([inflight], timeout=15)
+        if done:
+            _harvest(buf, inflight)
+
+    if buf["count"]:
+        last = (buf["head"] - 1) % RING_SIZE
+        ph_last = buf["pH"][last]
+        ec_last = buf["EC"][last]
+        temp_last = buf["temperature"][last]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("pH", f"{ph_last:.2f}" if not np.isnan(ph_last) else "—")
+        col2.metric("EC", f"{ec_last:.2f}" if not np.isnan(ec_last) else "—")
+        col3.metric("Temperature (°F)", f"{temp_last:.2f}" if not np.isnan(temp_last) else "—")
+
+        # Show timestamp in Eastern Time; datetime64[ms] converts straight
+        # to datetime.datetime, keeping pandas off the metrics path
+        naive = buf["time"][last].astype("datetime64[ms]").astype(_dt.datetime)
+        local_time = naive.replace(tzinfo=_dt.timezone.utc).astimezone(EASTERN)
+        h12 = local_time.hour % 12 or 12
+        ampm = "AM" if local_time.hour < 12 else "PM"
+        st.caption(
+            f"Last updated: {local_time.year:04d}-{local_time.month:02d}-{local_time.day:02d} "
+            f"{h12:02d}:{local_time.minute:02d}:{local_time.second:02d} {ampm} {local_time.tzname()}"
+        )
+    else:
+        st.info("Waiting for first reading …")
+
+    if buf["count"] > 1:
+        # A fragment rerun clears the fragment's elements, so the chart must
+        # be re-emitted every run; _chart_df keeps the frame itself cached
+        # until a new reading arrives.
+        st.line_chart(_chart_df(buf))
+    elif buf["count"] == 1:
+        st.write("Not enough data yet to plot a trend. Once more readings arrive, a line chart will appear.")
+
+
+if hasattr(st, "fragment"):
+    # Only the telemetry subtree reruns on each tick; the page chrome
+    # renders once per session.
+    _refresh = st.fragment(run_every=POLL_INTERVAL_SEC)(_telemetry_block)
+else:
+    def _refresh() -> None:
+        # Older Streamlit: fall back to a full-page autorefresh
+        from streamlit_autorefresh import st_autorefresh
+
+        st_autorefresh(interval=POLL_INTERVAL_SEC * 1000, limit=None, key="auto_refresh")
+        _telemetry_block()
+
+
+def main() -> None:
+    st.set_page_config(page_title="Edenic Telemetry Dashboard", layout="wide")
+    st.title("Edenic Telemetry Dashboard")
+
+    if "buf" not in st.session_state:
+        st.session_state["buf"] = load_buffer()
+    if "pending_rows" not in st.session_state:
+        st.session_state["pending_rows"] = []
+        st.session_state["last_flush"] = time.monotonic()
+        # Don't lose buffered rows when the process shuts down
+        atexit.register(_flush_rows, st.session_state["pending_rows"])
+
+    _refresh()
+
+    with st.expander("About this app", expanded=False):
+        st.markdown(
+            "This dashboard uses the Edenic API to poll for telemetry every 60 seconds. "
+            "It stores recent readings and displays a 24-hour chart of pH, EC, and temperature."
+        )
+
+if __name__ == "__main__":
+    main()
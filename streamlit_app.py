@@ -0,0 +1,6 @@
+"""Entry point for the dashboard: streamlit run streamlit_app.py"""
+
+from edenic_core import main
+
+if __name__ == "__main__":
+    main()
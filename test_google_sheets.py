@@ -1,11 +1,11 @@
 
 import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
 from datetime import datetime
 
 # Step 1: Define the scope and credentials file
 scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-creds = ServiceAccountCredentials.from_json_keyfile_name("gcreds.json", scope)
+creds = Credentials.from_service_account_file("gcreds.json", scopes=scope)
 
 # Step 2: Authorize client
 client = gspread.authorize(creds)